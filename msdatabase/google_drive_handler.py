@@ -1,108 +1,380 @@
 import os
 import io
-from typing import Dict, List
-
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
-from googleapiclient.errors import HttpError
-from google.oauth2.service_account import Credentials
+import time
+import logging
+import random
+import socket
+import asyncio
+import sqlite3
+import tarfile
+import functools
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
 
 from msdatabase.logger_config import get_logger
 
+# googleapiclient/google-auth pull in httplib2, uritemplate and cryptography;
+# importing them lazily keeps 'import msdatabase.google_drive_handler' cheap
+# for callers that never touch the network.
+_build = None
+
+def _get_build():
+    global _build
+    if _build is None:
+        from googleapiclient.discovery import build as _build
+    return _build
+
+_UNITS = ("bytes", "KB", "MB", "GB", "TB")
+
+def retry_on_http_error(codes: frozenset = frozenset({429, 500, 502, 503, 504}), tries: int = 5):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            from googleapiclient.errors import HttpError
+
+            for attempt in range(tries):
+                try:
+                    return func(self, *args, **kwargs)
+                except HttpError as e:
+                    if e.resp.status not in codes or attempt == tries - 1:
+                        self.logger.error(f"{func.__name__} failed with HTTP {e.resp.status}.")
+                        raise
+                    retry_after = e.resp.get('retry-after')
+                    if e.resp.status == 429 and retry_after:
+                        delay = float(retry_after)
+                    else:
+                        delay = min(2 ** attempt, 32) + random.random()
+                    self.logger.warning(
+                        f"HTTP {e.resp.status} in {func.__name__}, retrying in {delay:.1f}s ({attempt + 1}/{tries - 1})."
+                    )
+                    time.sleep(delay)
+        return wrapper
+    return decorator
+
 class GoogleDriveHandler:
+    SERVICE_ACCOUNT_FILE = os.environ.get(
+        'MS_SA_KEY', r'C:\Users\USUARIO\Downloads\ms-database-442116-07c57bef4cb7.json'
+    )
+    SCOPES = ['https://www.googleapis.com/auth/drive']
+
+    # Parsing the service-account key (PKCS#8/RSA) is expensive, so the
+    # Credentials object is shared across handler instances.
+    _cached_creds = None
+
     def __init__(self) -> None:
         self.logger = get_logger(self.__class__.__name__)
         self.logger.info("Initialized.")
 
-        self.SERVICE_ACCOUNT_FILE = r'C:\Users\USUARIO\Downloads\ms-database-442116-07c57bef4cb7.json'
-        self.SCOPES = ['https://www.googleapis.com/auth/drive']
+        self._cache_path = 'drive_meta.sqlite'
+        self._creds = None
+
+    def authenticate_service_account(self) -> "Credentials":
+        if GoogleDriveHandler._cached_creds is not None:
+            self._creds = GoogleDriveHandler._cached_creds
+            return self._creds
 
-    def authenticate_service_account(self) -> Credentials:
         self.logger.info("Authenticating service account.")
         try:
+            from google.oauth2.service_account import Credentials
+
             creds = Credentials.from_service_account_file(self.SERVICE_ACCOUNT_FILE, scopes=self.SCOPES)
+            GoogleDriveHandler._cached_creds = creds
+            self._creds = creds
             self.logger.info("Service account authenticated successfully.")
             return creds
         except Exception as e:
             self.logger.exception(f"Error authenticating service account: {type(e)}")
 
-    def create_drive_service(self, creds: Credentials):
+    def create_drive_service(self, creds: "Credentials"):
         self.logger.info("Creating Google Drive service.")
         try:
-            service = build('drive', 'v3', credentials=creds)
+            import httplib2
+            from google_auth_httplib2 import AuthorizedHttp
+
+            # A shared AuthorizedHttp keeps the TLS connection (and response
+            # cache) alive across sequential Drive calls; static_discovery
+            # serves the bundled drive-v3 discovery document, avoiding the
+            # HTTPS fetch + JSON parse on every process start.
+            http = AuthorizedHttp(creds, http=httplib2.Http(cache='.httpcache'))
+            service = _get_build()('drive', 'v3', http=http, cache_discovery=False, static_discovery=True)
             self.logger.info("Google Drive service created successfully.")
             return service
         except Exception as e:
             self.logger.exception(f"Error creating Google Drive service: {type(e)}")
 
+    def _execute_resumable(self, request, retries: int = 5):
+        from googleapiclient.errors import HttpError
+
+        response = None
+        attempt = 0
+        while response is None:
+            try:
+                status, response = request.next_chunk()
+                attempt = 0
+                if status and self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Upload %d%%.", int(status.progress() * 100))
+            except HttpError as e:
+                if e.resp.status not in (429, 500, 502, 503, 504) or attempt >= retries:
+                    raise
+                attempt += 1
+                delay = min(2 ** attempt, 32) + random.random()
+                self.logger.warning(f"Transient upload error {e.resp.status}, retrying in {delay:.1f}s.")
+                time.sleep(delay)
+        return response
+
+    @retry_on_http_error()
     def upload_pdf(self, service, local_pdf_path: str, drive_file_name: str) -> str:
         self.logger.info(f"Uploading PDF {local_pdf_path} to Google Drive as {drive_file_name}.")
         try:
+            from googleapiclient.errors import HttpError
+            from googleapiclient.http import MediaFileUpload
+
             file_metadata = {'name': drive_file_name}
-            media = MediaFileUpload(local_pdf_path, mimetype='application/pdf')
-            uploaded_file = service.files().create(body=file_metadata, media_body=media, fields='id').execute()
+            if os.path.getsize(local_pdf_path) < 5 * 1024 * 1024:
+                # Small files: single-shot upload saves the resumable initiation round-trip.
+                media = MediaFileUpload(local_pdf_path, mimetype='application/pdf')
+                uploaded_file = service.files().create(body=file_metadata, media_body=media, fields='id').execute()
+            else:
+                media = MediaFileUpload(local_pdf_path, mimetype='application/pdf', resumable=True, chunksize=8 * 1024 * 1024)
+                request = service.files().create(body=file_metadata, media_body=media, fields='id')
+                uploaded_file = self._execute_resumable(request)
             self.logger.info(f"File uploaded successfully with ID {uploaded_file.get('id')}.")
             return uploaded_file.get('id')
+        except HttpError:
+            raise
         except Exception as e:
             self.logger.exception(f"Error uploading PDF: {type(e)}")
 
+    async def upload_many(self, service, pairs: List[Tuple[str, str]], max_concurrent: int = 5) -> List[str]:
+        self.logger.info(f"Uploading {len(pairs)} PDFs with up to {max_concurrent} concurrent uploads.")
+        semaphore = asyncio.Semaphore(max_concurrent)
+        thread_service = self._thread_service_factory(service)
+
+        def upload_in_thread(local_pdf_path: str, drive_file_name: str) -> str:
+            return self.upload_pdf(thread_service(), local_pdf_path, drive_file_name)
+
+        async def upload_one(local_pdf_path: str, drive_file_name: str) -> str:
+            async with semaphore:
+                return await asyncio.to_thread(upload_in_thread, local_pdf_path, drive_file_name)
+
+        file_ids = await asyncio.gather(*(upload_one(path, name) for path, name in pairs))
+        self.logger.info("Concurrent upload batch completed.")
+        return list(file_ids)
+
+    def upload_bundle(self, service, pdf_paths: List[str], bundle_name: str) -> str:
+        self.logger.info(f"Bundling {len(pdf_paths)} PDFs into {bundle_name} for a single upload.")
+        try:
+            from googleapiclient.http import MediaIoBaseUpload
+
+            buf = io.BytesIO()
+            with tarfile.open(fileobj=buf, mode='w') as tf:
+                for pdf_path in pdf_paths:
+                    tf.add(pdf_path, arcname=os.path.basename(pdf_path))
+            buf.seek(0)
+
+            file_metadata = {'name': bundle_name}
+            media = MediaIoBaseUpload(buf, mimetype='application/x-tar', resumable=True, chunksize=8 * 1024 * 1024)
+            request = service.files().create(body=file_metadata, media_body=media, fields='id')
+            uploaded_file = self._execute_resumable(request)
+            self.logger.info(f"Bundle uploaded successfully with ID {uploaded_file.get('id')}.")
+            return uploaded_file.get('id')
+        except Exception as e:
+            self.logger.exception(f"Error uploading bundle: {type(e)}")
+
+    def download_bundle(self, service, file_id: str, destination_dir: str) -> None:
+        self.logger.info(f"Downloading bundle with ID {file_id} into {destination_dir}.")
+        try:
+            from googleapiclient.http import MediaIoBaseDownload
+
+            request = service.files().get_media(fileId=file_id)
+            buf = io.BytesIO()
+            downloader = MediaIoBaseDownload(buf, request, chunksize=8 * 1024 * 1024)
+            done = False
+            while not done:
+                status, done = downloader.next_chunk()
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Download %d%%.", int(status.progress() * 100))
+
+            buf.seek(0)
+            os.makedirs(destination_dir, exist_ok=True)
+            with tarfile.open(fileobj=buf, mode='r') as tf:
+                tf.extractall(destination_dir, filter='data')
+            self.logger.info(f"Bundle extracted to: {destination_dir}")
+        except Exception as e:
+            self.logger.exception(f"Error downloading bundle: {type(e)}")
+
+    @retry_on_http_error()
     def download_pdf(self, service, file_id: str, local_destination_path: str) -> None:
         self.logger.info(f"Downloading file with ID {file_id} to {local_destination_path}.")
         try:
+            from googleapiclient.errors import HttpError
+            from googleapiclient.http import MediaIoBaseDownload
+
             request = service.files().get_media(fileId=file_id)
-            with io.FileIO(local_destination_path, 'wb') as fh:
-                downloader = MediaIoBaseDownload(fh, request)
+            with io.BufferedWriter(io.FileIO(local_destination_path, 'wb'), buffer_size=1 << 20) as fh:
+                downloader = MediaIoBaseDownload(fh, request, chunksize=8 * 1024 * 1024)
                 done = False
                 while not done:
                     status, done = downloader.next_chunk()
-                    self.logger.info(f"Download {int(status.progress() * 100)}%.")
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("Download %d%%.", int(status.progress() * 100))
             self.logger.info(f"PDF downloaded as: {local_destination_path}")
+        except HttpError:
+            raise
         except Exception as e:
             self.logger.exception(f"Error downloading PDF: {type(e)}")
         
+    @retry_on_http_error()
     def delete_file(self, service, file_id: str) -> bool:
         self.logger.info(f"Attempting to delete file with ID {file_id}.")
         try:
+            from googleapiclient.errors import HttpError
+
             service.files().delete(fileId=file_id).execute()
             self.logger.info(f"File with ID {file_id} deleted successfully.")
             return True
+        except HttpError:
+            raise
         except Exception as e:
             self.logger.exception(f"Failed to delete file with ID {file_id}: {type(e)}")
             return False
             
-    def remove_duplicate_files(self, service) -> None:
-        self.logger.info("Removing duplicate files from Google Drive.")
+    def _thread_service_factory(self, service):
+        # googleapiclient's http object is not thread-safe, so each worker
+        # builds its own service from the shared credentials.
+        thread_services = threading.local()
+
+        def thread_service():
+            if getattr(thread_services, 'service', None) is None:
+                if self._creds is not None:
+                    thread_services.service = self.create_drive_service(self._creds)
+                else:
+                    thread_services.service = service
+            return thread_services.service
+
+        return thread_service
+
+    def download_many(self, service, pairs: List[Tuple[str, str]], max_workers: int = 4) -> None:
+        self.logger.info(f"Downloading {len(pairs)} files with up to {max_workers} workers.")
+        thread_service = self._thread_service_factory(service)
+
+        def download_one(pair):
+            file_id, local_destination_path = pair
+            self.download_pdf(thread_service(), file_id, local_destination_path)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(download_one, pairs))
+
+        self.logger.info("Concurrent download batch completed.")
+
+    def batch_delete(self, service, file_ids: List[str], batch_size: int = 100) -> None:
+        from googleapiclient.errors import HttpError
+
+        self.logger.info(f"Deleting {len(file_ids)} files in batches of {batch_size}.")
         try:
-            files = []
+            for start in range(0, len(file_ids), batch_size):
+                pending = file_ids[start:start + batch_size]
+
+                for attempt in range(3):
+                    deleted = set()
+
+                    def on_delete(request_id: str, response, exception) -> None:
+                        if exception is None:
+                            deleted.add(request_id)
+                            self.logger.info(f"File with ID {request_id} deleted successfully.")
+                        elif isinstance(exception, HttpError) and exception.resp.status == 404 and attempt > 0:
+                            # Deleted by an execute that timed out after the
+                            # server had already applied this call.
+                            deleted.add(request_id)
+                        else:
+                            self.logger.error(f"Failed to delete file with ID {request_id}: {exception}")
+
+                    batch = service.new_batch_http_request(callback=on_delete)
+                    for file_id in pending:
+                        batch.add(service.files().delete(fileId=file_id), request_id=file_id)
+
+                    try:
+                        batch.execute()
+                        break
+                    except socket.timeout:
+                        # Retry only the ids whose callback did not confirm
+                        # success, so completed deletes are not re-sent.
+                        pending = [file_id for file_id in pending if file_id not in deleted]
+                        if not pending:
+                            break
+                        delay = min(2 ** attempt, 8) + random.random()
+                        self.logger.warning(
+                            f"Batch delete timed out, retrying {len(pending)} ids in {delay:.1f}s ({attempt + 1}/3)."
+                        )
+                        time.sleep(delay)
+                else:
+                    self.logger.error("Batch delete failed after 3 timeouts.")
+        except Exception as e:
+            self.logger.exception(f"Error executing batch delete: {type(e)}")
+
+    def _list_files_by_names(self, service, names: Set[str], batch_size: int = 40) -> List[Dict[str, str]]:
+        files = []
+        names = sorted(names)
+        # ~40 names per query keeps the q expression under the URL length limit.
+        for start in range(0, len(names), batch_size):
+            batch = names[start:start + batch_size]
+            name_filter = " or ".join(
+                "name='{}'".format(name.replace("\\", "\\\\").replace("'", "\\'")) for name in batch
+            )
             page_token = None
             while True:
-                results = service.files().list(fields="files(id, name), nextPageToken", pageToken=page_token).execute()
+                results = service.files().list(
+                    pageSize=1000,
+                    q=f"({name_filter}) and trashed=false",
+                    fields="nextPageToken, files(id,name)",
+                    pageToken=page_token,
+                    spaces='drive'
+                ).execute()
                 files.extend(results.get('files', []))
                 page_token = results.get('nextPageToken')
                 if not page_token:
                     break
+        return files
+
+    def remove_duplicate_files(self, service, expected_names: Optional[Set[str]] = None) -> None:
+        self.logger.info("Removing duplicate files from Google Drive.")
+        try:
+            if expected_names:
+                # Filtering by name on the server avoids transferring the
+                # metadata of every file just to group a known set of names.
+                files = self._list_files_by_names(service, expected_names)
+            else:
+                files = []
+                page_token = None
+                while True:
+                    results = service.files().list(
+                        pageSize=1000,
+                        q="trashed=false and mimeType='application/pdf'",
+                        fields="nextPageToken, files(id,name)",
+                        pageToken=page_token,
+                        spaces='drive'
+                    ).execute()
+                    files.extend(results.get('files', []))
+                    page_token = results.get('nextPageToken')
+                    if not page_token:
+                        break
 
             if not files:
                 self.logger.info("No files found.")
                 return
 
-            file_names = {}
-            duplicate_files_ids = []
-
+            groups = defaultdict(list)
             for file in files:
-                file_name = file['name']
-                file_id = file['id']
+                groups[file['name']].append(file['id'])
 
-                if file_name in file_names:
-                    duplicate_files_ids.append(file_id)
-                else:
-                    file_names[file_name] = file_id
+            duplicate_files_ids = [file_id for ids in groups.values() for file_id in ids[1:]]
 
             if duplicate_files_ids:
                 self.logger.info(f"{len(duplicate_files_ids)} duplicate files found.")
 
-                for file_id in duplicate_files_ids:
-                    self.delete_file(service, file_id)
+                self.batch_delete(service, duplicate_files_ids)
 
                 self.logger.info("Duplicate file removal process completed.")
             else:
@@ -111,64 +383,135 @@ class GoogleDriveHandler:
         except Exception as e:
             self.logger.exception(f"An error occurred while removing duplicate files: {type(e)}")
         
+    def _open_cache(self) -> sqlite3.Connection:
+        cache = sqlite3.connect(self._cache_path)
+        cache.execute("CREATE TABLE IF NOT EXISTS files (id TEXT PRIMARY KEY, name TEXT)")
+        cache.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        return cache
+
+    def _rebuild_cache(self, service, cache: sqlite3.Connection) -> None:
+        self.logger.info("Building local metadata cache from a full drive listing.")
+        start_token = service.changes().getStartPageToken().execute()['startPageToken']
+
+        rows = []
+        page_token = None
+        while True:
+            results = service.files().list(
+                pageSize=1000,
+                q="trashed=false and mimeType='application/pdf'",
+                fields="nextPageToken, files(id,name)",
+                pageToken=page_token,
+                spaces='drive'
+            ).execute()
+
+            rows.extend((file['id'], file['name']) for file in results.get('files', []))
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                break
+
+        cache.execute("DELETE FROM files")
+        cache.executemany("INSERT INTO files (id, name) VALUES (?, ?)", rows)
+        cache.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('startPageToken', ?)", (start_token,))
+        cache.commit()
+
+    def _refresh_cache(self, service, cache: sqlite3.Connection, page_token: str) -> None:
+        self.logger.info("Refreshing local metadata cache from the changes feed.")
+        while page_token:
+            results = service.changes().list(
+                pageToken=page_token,
+                fields="newStartPageToken,nextPageToken,changes(fileId,removed,file(id,name,trashed,mimeType))"
+            ).execute()
+
+            removed = []
+            updated = []
+            for change in results.get('changes', []):
+                file = change.get('file')
+                # Mirror the seed listing's filters: trashing sets
+                # file.trashed without removed=True, and non-PDF changes
+                # must not leak into the cache.
+                if change.get('removed') or not file or file.get('trashed'):
+                    removed.append((change['fileId'],))
+                elif file.get('mimeType') != 'application/pdf':
+                    removed.append((change['fileId'],))
+                else:
+                    updated.append((file['id'], file['name']))
+
+            cache.executemany("DELETE FROM files WHERE id = ?", removed)
+            cache.executemany("INSERT OR REPLACE INTO files (id, name) VALUES (?, ?)", updated)
+
+            new_token = results.get('newStartPageToken')
+            if new_token:
+                cache.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('startPageToken', ?)", (new_token,))
+            page_token = results.get('nextPageToken')
+
+        cache.commit()
+
+    @retry_on_http_error()
     def list_files(self, service) -> List[Dict[str, str]]:
         self.logger.info("Listing files from Google Drive.")
         try:
-            file_list = []
-            page_token = None
+            from googleapiclient.errors import HttpError
 
-            while True:
-                results = service.files().list(
-                    fields="files(id, name), nextPageToken", 
-                    pageToken=page_token
-                ).execute()
-                
-                files = results.get('files', [])
-                
-                if not files:
-                    self.logger.info("No files found.")
-                    break
-                
-                self.logger.info(f"Found {len(files)} files.")
-                for file in files:
-                    self.logger.info(f"Name: {file['name']}, ID: {file['id']}")
-                    file_list.append({'name': file['name'], 'id': file['id']})
-                
-                page_token = results.get('nextPageToken')
-                if not page_token:
-                    break
+            cache = self._open_cache()
+            try:
+                row = cache.execute("SELECT value FROM meta WHERE key = 'startPageToken'").fetchone()
+                if row:
+                    try:
+                        self._refresh_cache(service, cache, row[0])
+                    except HttpError as e:
+                        # An expired/invalid change token comes back as a
+                        # non-retryable 4xx; re-list instead of staying wedged
+                        # on the stale token forever.
+                        if e.resp.status not in (400, 404, 410):
+                            raise
+                        self.logger.warning(
+                            f"Stored change token rejected with HTTP {e.resp.status}, rebuilding cache."
+                        )
+                        self._rebuild_cache(service, cache)
+                else:
+                    self._rebuild_cache(service, cache)
+
+                file_list = [
+                    {'name': name, 'id': file_id}
+                    for file_id, name in cache.execute("SELECT id, name FROM files")
+                ]
+            finally:
+                cache.close()
+
+            if not file_list:
+                self.logger.info("No files found.")
+            else:
+                self.logger.info(f"Found {len(file_list)} files.")
 
             return file_list
 
+        except HttpError:
+            raise
         except Exception as e:
             self.logger.exception(f"An error occurred while listing files: {type(e)}")
             return []
         
+    @retry_on_http_error()
     def get_drive_info(self, service) -> Dict[str, str]:
         self.logger.info("Retrieving Google Drive storage information.")
-        try:
-            drive_info = service.about().get(fields="storageQuota").execute()
+        drive_info = service.about().get(fields="storageQuota").execute()
 
-            quota = drive_info.get('storageQuota', {})
-            total_space = quota.get('limit', 'N/A')
-            used_space = quota.get('usage', 'N/A')
+        quota = drive_info.get('storageQuota', {})
+        total_space = quota.get('limit', 'N/A')
+        used_space = quota.get('usage', 'N/A')
 
-            if total_space != 'N/A':
-                total_space = self.convert_bytes(total_space)
-            if used_space != 'N/A':
-                used_space = self.convert_bytes(used_space)
+        if total_space != 'N/A':
+            total_space = self.convert_bytes(total_space)
+        if used_space != 'N/A':
+            used_space = self.convert_bytes(used_space)
 
-            self.logger.info(f"Total Space: {total_space}")
-            self.logger.info(f"Used Space: {used_space}")
-            
-            return {
-                'total_space': total_space,
-                'used_space': used_space
-            }
+        self.logger.info(f"Total Space: {total_space}")
+        self.logger.info(f"Used Space: {used_space}")
 
-        except HttpError as e:
-            self.logger.error(f"Error accessing Google Drive: {e}")
-            return {}
+        return {
+            'total_space': total_space,
+            'used_space': used_space
+        }
 
     def convert_bytes(self, bytes_size: str) -> str:
         if bytes_size == 'N/A':
@@ -177,12 +520,9 @@ class GoogleDriveHandler:
             bytes_size = int(bytes_size)
             if bytes_size < 1024:
                 return f"{bytes_size} bytes"
-            elif bytes_size < 1024 * 1024:
-                return f"{bytes_size / 1024:.2f} KB"
-            elif bytes_size < 1024 * 1024 * 1024:
-                return f"{bytes_size / (1024 * 1024):.2f} MB"
-            else:
-                return f"{bytes_size / (1024 * 1024 * 1024):.2f} GB"
+            # bit_length picks the 1024**k unit without a compare-and-divide ladder.
+            unit = min((bytes_size.bit_length() - 1) // 10, len(_UNITS) - 1)
+            return f"{bytes_size / (1 << (10 * unit)):.2f} {_UNITS[unit]}"
         except ValueError as e:
             self.logger.error(f'An error occurred during conversion: {str(e)}')
             return 'Invalid size'
@@ -208,20 +548,17 @@ if __name__ == '__main__':
     # local_pdf_path = r'D:\Projects\mslookup\data\registers_pdf\100380043_01-05-2029.pdf'
     # drive_file_name = '100380043.pdf'
     # pdf_file_id = handler.upload_pdf(drive_service, local_pdf_path, drive_file_name)
-    for local_pdf_path, drive_file_name in pdf_files_to_upload:
-        pdf_file_id = handler.upload_pdf(drive_service, local_pdf_path, drive_file_name)
+    pdf_file_ids = asyncio.run(handler.upload_many(drive_service, pdf_files_to_upload))
+    for pdf_file_id in pdf_file_ids:
         print(pdf_file_id)
-    
-    # for i in range(5):
-    #     for local_pdf_path, drive_file_name in pdf_files_to_upload:
-    #         pdf_file_id = handler.upload_pdf(drive_service, local_pdf_path, drive_file_name)
-    #         print(pdf_file_id)
         
-    handler.remove_duplicate_files(drive_service)
+    handler.remove_duplicate_files(drive_service, expected_names={name for _, name in pdf_files_to_upload})
     files = handler.list_files(drive_service)
     
-    for file in files:
-        local_destination_path = os.path.join(os.path.expanduser('~'), 'Downloads', file['name'])
-        handler.download_pdf(drive_service, file['id'], local_destination_path)
+    pdf_files_to_download = [
+        (file['id'], os.path.join(os.path.expanduser('~'), 'Downloads', file['name']))
+        for file in files
+    ]
+    handler.download_many(drive_service, pdf_files_to_download)
         
     
\ No newline at end of file
@@ -3,7 +3,9 @@ from typing import List, Optional
 from sqlalchemy import create_engine, text, MetaData, Table, Column, Integer, String, ForeignKey, insert, select, bindparam
 from sqlalchemy.orm import Session, DeclarativeBase, Mapped, mapped_column, relationship
 
-engine = create_engine("sqlite+pysqlite:///:memory:", echo=True)
+# echo=True roteia cada SQL compilado pelo logging; para diagnóstico use
+# logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO).
+engine = create_engine("sqlite+pysqlite:///:memory:", echo=False, insertmanyvalues_page_size=1000)
 metadata_obj = MetaData()
 user_table = Table(
     "user_account",
@@ -21,50 +23,45 @@ address_table = Table(
     Column("email_address", String, nullable=False),
 )
 
-with engine.connect() as conn:
+# Um único escopo transacional amortiza o checkout de conexão e o
+# begin/commit entre todas as instruções da demonstração.
+with engine.begin() as conn:
     result = conn.execute(text("CREATE TABLE some_table (x int, y int)"))
     conn.execute(
         text("INSERT INTO some_table (x, y) VALUES (:x, :y)"),
         [{"x": 1, "y": 1}, {"x": 2, "y": 4}],
     )
-    conn.commit()
-    
-print("#######################################################################")
-with engine.begin() as conn:
+
+    print("#######################################################################")
     conn.execute(
         text("INSERT INTO some_table (x, y) VALUES (:x, :y)"),
         [{"x": 6, "y": 8}, {"x": 9, "y": 10}],
     )
-    
-print("#######################################################################")
-with engine.connect() as conn:
+
+    print("#######################################################################")
     result = conn.execute(text("SELECT x, y FROM some_table"))
     for row in result:
         print(f"x: {row.x} y: {row.y}")
-        
-print("#######################################################################")
-with engine.connect() as conn:
+
+    print("#######################################################################")
     result = conn.execute(text("SELECT x, y FROM some_table WHERE y > :y"), {"y": 2})
     for row in result:
         print(f"x: {row.x} y: {row.y}")
-        
-print("#######################################################################")
-with engine.connect() as conn:
+
+    print("#######################################################################")
     conn.execute(
         text("INSERT INTO some_table (x, y) VALUES (:x, :y)"),
         [{"x": 11, "y": 12}, {"x": 13, "y": 14}],
     )
-    conn.commit()
-    
+
 print("#######################################################################")
-stmt = text("SELECT x, y FROM some_table WHERE y > :y ORDER BY x, y")
 with Session(engine) as session:
+    stmt = text("SELECT x, y FROM some_table WHERE y > :y ORDER BY x, y")
     result = session.execute(stmt, {"y": 6})
     for row in result:
         print(f"x: {row.x} y: {row.y}")
-        
-print("#######################################################################")
-with Session(engine) as session:
+
+    print("#######################################################################")
     result = session.execute(
         text("UPDATE some_table SET y=:y WHERE x=:x"),
         [{"x": 9, "y": 11}, {"x": 13, "y": 15}],
@@ -113,31 +110,25 @@ print(stmt)
 compiled = stmt.compile()
 print(compiled.params)
 
-print("############################################## Executando a Declaração #############################################")
-with engine.connect() as conn:
-    result = conn.execute(stmt)
-    conn.commit()
-    print(result.inserted_primary_key)    
-    
 print("############################# INSERT geralmente gera a cláusula “values” automaticamente ###########################")
 print(insert(user_table))
-with engine.connect() as conn:
-    result = conn.execute(
-        insert(user_table),
-        [
-            {"name": "sandy", "fullname": "Sandy Cheeks"},
-            {"name": "patrick", "fullname": "Patrick Start"},
-        ],
-    )
-    conn.commit()
-    
+
+print("############################################## Executando a Declaração #############################################")
+user_rows = [
+    {"name": "spongebob", "fullname": "Spongebob Squarepants"},
+    {"name": "sandy", "fullname": "Sandy Cheeks"},
+    {"name": "patrick", "fullname": "Patrick Start"},
+]
 scalar_subq = (
     select(user_table.c.id)
     .where(user_table.c.name == bindparam("username"))
     .scalar_subquery()
 )
 
-with engine.connect() as conn:
+with engine.begin() as conn:
+    result = conn.execute(insert(user_table), user_rows)
+    print(result.inserted_primary_key_rows)
+
     result = conn.execute(
         insert(address_table).values(user_id=scalar_subq),
         [
@@ -149,7 +140,6 @@ with engine.connect() as conn:
             {"username": "sandy", "email_address": "sandy@squirrelpower.org"},
         ],
     )
-    conn.commit()
     
 print("################################################# INSERIR…RETORNANDO ###############################################")
 insert_stmt = insert(address_table).returning(